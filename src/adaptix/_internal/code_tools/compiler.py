@@ -2,6 +2,7 @@ import linecache
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from threading import Lock
+from types import CodeType
 from typing import Any, Callable
 
 from .code_builder import CodeBuilder
@@ -44,6 +45,33 @@ class ConcurrentCounter:
 _counter = ConcurrentCounter()
 
 
+class CodeCache:
+    """Caches code objects by source, so identical closures are compiled once"""
+
+    __slots__ = ("_lock", "_max_size", "_source_to_code")
+
+    def __init__(self, max_size: int):
+        self._lock = Lock()
+        self._max_size = max_size
+        self._source_to_code: dict[str, CodeType] = {}
+
+    def get_or_compile(self, source: str, filename: str) -> CodeType:
+        try:
+            return self._source_to_code[source]
+        except KeyError:
+            pass
+
+        code_obj = compile(source, filename, "exec")
+        with self._lock:
+            if len(self._source_to_code) >= self._max_size:
+                self._source_to_code.pop(next(iter(self._source_to_code)))
+            self._source_to_code[source] = code_obj
+        return code_obj
+
+
+_code_cache = CodeCache(max_size=1024)
+
+
 class BasicClosureCompiler(ClosureCompiler):
     def _make_source_builder(self, builder: CodeBuilder) -> CodeBuilder:
         main_builder = CodeBuilder()
@@ -55,7 +83,7 @@ class BasicClosureCompiler(ClosureCompiler):
         return main_builder
 
     def _compile(self, source: str, unique_filename: str, namespace: dict[str, Any]):
-        code_obj = compile(source, unique_filename, "exec")
+        code_obj = _code_cache.get_or_compile(source, unique_filename)
 
         local_namespace: dict[str, Any] = {}
         exec(code_obj, namespace, local_namespace)  # noqa: S102
@@ -1,7 +1,8 @@
 from collections.abc import Mapping
-from typing import Any, Callable, Literal, Optional, TypeVar, Union
+from functools import partial
+from typing import Any, Callable, Literal, Optional, Union
 
-from ...common import Dumper, Loader
+from ...common import Dumper, Loader, TypeHint
 from ...morphing.load_error import LoadError
 from ...morphing.provider_template import DumperProvider, LoaderProvider
 from ...morphing.request_cls import DumperRequest, LoaderRequest
@@ -17,9 +18,6 @@ except ImportError:
     pass
 
 
-T = TypeVar("T")
-
-
 class NativePydanticProvider(LoaderProvider, DumperProvider):
     def __init__(
         self,
@@ -28,15 +26,18 @@ class NativePydanticProvider(LoaderProvider, DumperProvider):
         serialization_params: Mapping[str, Omittable[Any]],
     ):
         self._config = config
-        self._validation_params = validation_params
-        self._serialization_params = serialization_params
+        self._validation_params: Mapping[str, Any] = self._skip_omitted(validation_params)
+        self._serialization_params: Mapping[str, Any] = self._skip_omitted(serialization_params)
 
-    def _skip_omitted(self, mapping: Mapping[str, T]) -> Mapping[str, T]:
-        return {k: v for k, v in mapping.items() if v != Omitted()}
+    def _skip_omitted(self, mapping: Mapping[str, Omittable[Any]]) -> Mapping[str, Any]:
+        return {k: v for k, v in mapping.items() if v is not Omitted()}
 
     def provide_loader(self, mediator: Mediator, request: LoaderRequest) -> Loader:
-        validation_params = self._skip_omitted(self._validation_params)
-        validator = TypeAdapter(request.last_loc.type, config=self._config).validator.validate_python
+        return mediator.cached_call(self._make_loader, request.last_loc.type)
+
+    def _make_loader(self, tp: TypeHint) -> Loader:
+        validation_params = self._validation_params
+        validator = TypeAdapter(tp, config=self._config).validator.validate_python
 
         if not validation_params:
             def native_pydantic_loader_no_params(data):
@@ -56,16 +57,15 @@ class NativePydanticProvider(LoaderProvider, DumperProvider):
         return native_pydantic_loader
 
     def provide_dumper(self, mediator: Mediator, request: DumperRequest) -> Dumper:
-        serialization_params = self._skip_omitted(self._serialization_params)
-        serializer = TypeAdapter(request.last_loc.type, config=self._config).serializer.to_python
+        return mediator.cached_call(self._make_dumper, request.last_loc.type)
+
+    def _make_dumper(self, tp: TypeHint) -> Dumper:
+        serialization_params = self._serialization_params
+        serializer = TypeAdapter(tp, config=self._config).serializer.to_python
 
         if not serialization_params:
             return serializer
-
-        def native_pydantic_dumper(data):
-            return serializer(data, **serialization_params)
-
-        return native_pydantic_dumper
+        return partial(serializer, **serialization_params)
 
 
 def native_pydantic(
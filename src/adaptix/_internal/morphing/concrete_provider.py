@@ -448,8 +448,11 @@ INT_PROVIDER = ScalarProvider(
 )
 
 
+_FLOAT_STRICT_COERCION_TYPES = (float, int)
+
+
 def float_strict_coercion_loader(data):
-    if type(data) in (float, int):
+    if type(data) in _FLOAT_STRICT_COERCION_TYPES:
         return float(data)
     raise TypeLoadError(Union[float, int], data)
 
@@ -536,8 +539,11 @@ DECIMAL_PROVIDER = ScalarProvider(
 )
 
 
+_FRACTION_STRICT_COERCION_TYPES = (str, Fraction)
+
+
 def fraction_strict_coercion_loader(data):
-    if type(data) in (str, Fraction):
+    if type(data) in _FRACTION_STRICT_COERCION_TYPES:
         try:
             return Fraction(data)
         except ValueError:
@@ -566,8 +572,11 @@ FRACTION_PROVIDER = ScalarProvider(
 )
 
 
+_COMPLEX_STRICT_COERCION_TYPES = (str, complex)
+
+
 def complex_strict_coercion_loader(data):
-    if type(data) in (str, complex):
+    if type(data) in _COMPLEX_STRICT_COERCION_TYPES:
         try:
             return complex(data)
         except ValueError:
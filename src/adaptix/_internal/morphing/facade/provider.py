@@ -285,7 +285,7 @@ def with_property(
         pred,
         PropertyExtender(
             output_fields=[field],
-            infer_types_for=[field.id] if tp == Omitted() else [],
+            infer_types_for=[field.id] if tp is Omitted() else [],
         ),
     )
 
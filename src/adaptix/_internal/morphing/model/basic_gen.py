@@ -122,10 +122,7 @@ def _collect_used_direct_fields(crown: BaseCrown) -> set[str]:
 def get_skipped_fields(shape: BaseShape, name_layout: BaseNameLayout) -> Set[str]:
     used_direct_fields = _collect_used_direct_fields(name_layout.crown)
     extra_targets = name_layout.extra_move.fields if isinstance(name_layout.extra_move, ExtraTargets) else ()
-    return {
-        field.id for field in shape.fields
-        if field.id not in used_direct_fields and field.id not in extra_targets
-    }
+    return (shape.fields_dict.keys() - used_direct_fields).difference(extra_targets)
 
 
 def _inner_get_extra_targets_at_crown(extra_targets: Container[str], crown: BaseCrown) -> Collection[str]:
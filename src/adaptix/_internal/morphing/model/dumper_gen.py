@@ -117,7 +117,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
             if isinstance(self._name_layout.extra_move, ExtraTargets)
             else ()
         )
-        self._id_to_field: dict[str, OutputField] = {field.id: field for field in self._shape.fields}
+        self._id_to_field: Mapping[str, OutputField] = self._shape.fields_dict
         self._model_identity = model_identity
 
     def produce_code(self, closure_name: str) -> tuple[str, Mapping[str, object]]:
@@ -702,7 +702,7 @@ class ModelOutputJSONSchemaGen:
         field = self._shape.fields_dict[crown.id]
         json_schema = self._field_json_schema_getter(field)
         default = self._field_default_dumper(field)
-        if default != Omitted():
+        if default is not Omitted():
             return replace(json_schema, default=default)
         return json_schema
 
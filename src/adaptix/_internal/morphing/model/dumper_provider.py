@@ -231,7 +231,7 @@ class ModelDumperProvider(DumperProvider, JSONSchemaProvider):
 
     def _validate_params(self, shape: OutputShape, name_layout: OutputNameLayout) -> None:
         optional_fields_at_list_crown = get_optional_fields_at_list_crown(
-            {field.id: field for field in shape.fields},
+            shape.fields_dict,
             name_layout.crown,
         )
         if optional_fields_at_list_crown:
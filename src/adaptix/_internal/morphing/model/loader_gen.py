@@ -107,7 +107,7 @@ class GenState(Namer):
         self,
         builder: CodeBuilder,
         namespace: CascadeNamespace,
-        name_to_field: dict[str, InputField],
+        name_to_field: Mapping[str, InputField],
         debug_trail: DebugTrail,
         root_crown: InpCrown,
     ):
@@ -193,9 +193,7 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         self._name_layout = name_layout
         self._debug_trail = debug_trail
         self._strict_coercion = strict_coercion
-        self._id_to_field: dict[str, InputField] = {
-            field.id: field for field in self._shape.fields
-        }
+        self._id_to_field: Mapping[str, InputField] = self._shape.fields_dict
         self._field_id_to_param: dict[str, Param] = {
             param.field_id: param for param in self._shape.params
         }
@@ -835,7 +833,7 @@ class ModelInputJSONSchemaGen:
         field = self._shape.fields_dict[crown.id]
         json_schema = self._field_json_schema_getter(field)
         default = self._field_default_dumper(field)
-        if default != Omitted():
+        if default is not Omitted():
             return replace(json_schema, default=default)
         return json_schema
 
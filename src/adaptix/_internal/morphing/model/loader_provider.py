@@ -44,11 +44,13 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
     def provide_loader(self, mediator: Mediator, request: LoaderRequest) -> Loader:
         shape = self._fetch_shape(mediator, request)
         name_layout = self._fetch_name_layout(mediator, request, shape)
+        skipped_fields = self._fetch_skipped_fields(mediator, shape, name_layout)
         field_loaders = self._fetch_field_loaders(mediator, request, shape)
         return mediator.cached_call(
             self._make_loader,
             shape=shape,
             name_layout=name_layout,
+            skipped_fields=skipped_fields,
             field_loaders=OrderedMappingHashWrapper(field_loaders),
             strict_coercion=mediator.mandatory_provide(StrictCoercionRequest(loc_stack=request.loc_stack)),
             debug_trail=mediator.mandatory_provide(DebugTrailRequest(loc_stack=request.loc_stack)),
@@ -63,6 +65,7 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
         *,
         shape: InputShape,
         name_layout: InputNameLayout,
+        skipped_fields: Set[str],
         field_loaders: OrderedMappingHashWrapper[Mapping[str, Loader]],
         strict_coercion: bool,
         debug_trail: DebugTrail,
@@ -71,8 +74,6 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
         closure_name: str,
         file_name: str,
     ) -> Loader:
-        skipped_fields = get_skipped_fields(shape, name_layout)
-        self._validate_params(shape, name_layout, skipped_fields)
         loader_gen = self._create_model_loader_gen(
             debug_trail=debug_trail,
             strict_coercion=strict_coercion,
@@ -98,8 +99,7 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
 
         shape = self._fetch_shape(mediator, request)
         name_layout = self._fetch_name_layout(mediator, request, shape)
-        skipped_fields = get_skipped_fields(shape, name_layout)
-        self._validate_params(shape, name_layout, skipped_fields)
+        self._fetch_skipped_fields(mediator, shape, name_layout)
         schema_gen = self._get_schema_gen(mediator, request, shape)
         return schema_gen.convert_crown(name_layout.crown)
 
@@ -144,8 +144,7 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
     def _fetch_model_loader_gen(self, mediator: Mediator, request: LoaderRequest) -> ModelLoaderGen:
         shape = self._fetch_shape(mediator, request)
         name_layout = self._fetch_name_layout(mediator, request, shape)
-        skipped_fields = get_skipped_fields(shape, name_layout)
-        self._validate_params(shape, name_layout, skipped_fields)
+        skipped_fields = self._fetch_skipped_fields(mediator, shape, name_layout)
 
         field_loaders = self._fetch_field_loaders(mediator, request, shape)
         strict_coercion = mediator.mandatory_provide(StrictCoercionRequest(loc_stack=request.loc_stack))
@@ -240,6 +239,19 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
         )
         return {field.id: loader for field, loader in zip(shape.fields, loaders)}
 
+    def _fetch_skipped_fields(
+        self,
+        mediator: Mediator,
+        shape: InputShape,
+        name_layout: InputNameLayout,
+    ) -> Set[str]:
+        return mediator.cached_call(self._get_validated_skipped_fields, shape=shape, name_layout=name_layout)
+
+    def _get_validated_skipped_fields(self, *, shape: InputShape, name_layout: InputNameLayout) -> Set[str]:
+        skipped_fields = frozenset(get_skipped_fields(shape, name_layout))
+        self._validate_params(shape, name_layout, skipped_fields)
+        return skipped_fields
+
     def _validate_params(
         self,
         shape: InputShape,
@@ -269,7 +281,7 @@ class ModelLoaderProvider(LoaderProvider, JSONSchemaProvider):
             )
 
         optional_fields_at_list_crown = get_optional_fields_at_list_crown(
-            {field.id: field for field in shape.fields},
+            shape.fields_dict,
             name_layout.crown,
         )
         if optional_fields_at_list_crown:
@@ -44,29 +44,65 @@ def requires(requirement: Requirement):
 E = TypeVar("E", bound=Exception)
 
 
+def _repr_dataclass_fields(obj: Any) -> dict[str, Any]:
+    return {
+        fld.name: _repr_value(getattr(obj, fld.name))
+        for fld in dataclasses.fields(obj)
+    }
+
+
+def _repr_exception_group_fields(obj: CompatExceptionGroup) -> dict[str, Any]:
+    return {
+        "message": obj.message,
+        "exceptions": [_repr_value(exc) for exc in obj.exceptions],
+    }
+
+
+def _repr_cannot_provide_fields(obj: CannotProvide) -> dict[str, Any]:
+    return {
+        "message": obj.message,
+        "is_terminal": obj.is_terminal,
+        "is_demonstrative": obj.is_demonstrative,
+    }
+
+
+def _repr_provider_not_found_fields(obj: ProviderNotFoundError) -> dict[str, Any]:
+    return {"message": obj.message}
+
+
+_FieldsRepr = Callable[[Any], dict[str, Any]]
+_FIELDS_REPRS_CACHE: dict[type, Sequence[_FieldsRepr]] = {}
+
+
+def _get_fields_reprs(exc_type: type[Exception]) -> Sequence[_FieldsRepr]:
+    try:
+        return _FIELDS_REPRS_CACHE[exc_type]
+    except KeyError:
+        pass
+
+    fields_reprs = [
+        fields_repr
+        for condition, fields_repr in [
+            (is_dataclass(exc_type), _repr_dataclass_fields),
+            (issubclass(exc_type, CompatExceptionGroup), _repr_exception_group_fields),
+            (issubclass(exc_type, CannotProvide), _repr_cannot_provide_fields),
+            (issubclass(exc_type, ProviderNotFoundError), _repr_provider_not_found_fields),
+        ]
+        if condition
+    ]
+    _FIELDS_REPRS_CACHE[exc_type] = fields_reprs
+    return fields_reprs
+
+
 def _repr_value(obj: Any) -> dict[str, Any]:
     if not isinstance(obj, Exception):
         return obj
 
     result = {}
-    if is_dataclass(obj):
-        result.update(
-            **{
-                fld.name: _repr_value(getattr(obj, fld.name))
-                for fld in dataclasses.fields(obj)
-            },
-        )
-    if isinstance(obj, CompatExceptionGroup):
-        result["message"] = obj.message
-        result["exceptions"] = [_repr_value(exc) for exc in obj.exceptions]
-    if isinstance(obj, CannotProvide):
-        result["message"] = obj.message
-        result["is_terminal"] = obj.is_terminal
-        result["is_demonstrative"] = obj.is_demonstrative
-    if isinstance(obj, ProviderNotFoundError):
-        result["message"] = obj.message
+    for fields_repr in _get_fields_reprs(type(obj)):
+        result.update(fields_repr(obj))
     if not result:
-        result["args"] = [_repr_value(arg) for arg in obj.args]
+        result["args"] = [_repr_value(arg) if isinstance(arg, Exception) else arg for arg in obj.args]
     return {
         "__type__": type(obj),
         "__trail__": list(get_trail(obj)),
@@ -76,18 +112,34 @@ def _repr_value(obj: Any) -> dict[str, Any]:
     }
 
 
+def _is_equal_plain_exc(actual: Exception, expected: Any) -> bool:
+    """Cheap check that is sufficient for exceptions represented only by their args.
+    A negative result is not decisive, structural comparison must be used then
+    """
+    return (
+        type(actual) is type(expected)
+        and not _get_fields_reprs(type(expected))
+        and actual.__cause__ is None
+        and expected.__cause__ is None
+        and actual.args == expected.args
+        and getattr(actual, "__notes__", []) == getattr(expected, "__notes__", [])
+        and list(get_trail(actual)) == list(get_trail(expected))
+    )
+
+
 def raises_exc(
     exc: Union[type[E], E],
     func: Callable[[], Any],
     *,
-    match: Optional[str] = None,
+    match: Union[str, re.Pattern[str], None] = None,
 ) -> E:
     exc_type = exc if isinstance(exc, type) else type(exc)
 
     with pytest.raises(exc_type, match=match) as exc_info:
         func()
 
-    assert _repr_value(exc_info.value) == _repr_value(exc)
+    if not _is_equal_plain_exc(exc_info.value, exc):
+        assert _repr_value(exc_info.value) == _repr_value(exc)
 
     return exc_info.value
 
@@ -138,8 +190,8 @@ class PlaceholderProvider(Provider):
         return []
 
 
-def full_match(string_to_match: str) -> str:
-    return "^" + re.escape(string_to_match) + "$"
+def full_match(string_to_match: str) -> re.Pattern[str]:
+    return re.compile("^" + re.escape(string_to_match) + "$")
 
 
 def pretty_typehint_test_id(config, val, argname):
@@ -160,17 +212,21 @@ T3 = TypeVar("T3")
 
 
 class ByTrailSelector:
+    _DEBUG_TRAIL_TO_IDX = {
+        DebugTrail.DISABLE: 0,
+        DebugTrail.FIRST: 1,
+        DebugTrail.ALL: 2,
+    }
+
     def __init__(self, debug_trail: DebugTrail):
         self.debug_trail = debug_trail
+        try:
+            self._idx = self._DEBUG_TRAIL_TO_IDX[debug_trail]
+        except KeyError:
+            raise ValueError from None
 
     def __call__(self, *, disable: T1, first: T2, all: T3) -> Union[T1, T2, T3]:  # noqa: A002
-        if self.debug_trail == DebugTrail.DISABLE:
-            return disable
-        if self.debug_trail == DebugTrail.FIRST:
-            return first
-        if self.debug_trail == DebugTrail.ALL:
-            return all
-        raise ValueError
+        return (disable, first, all)[self._idx]
 
 
 def load_namespace(
@@ -180,7 +236,7 @@ def load_namespace(
     run_name: Optional[str] = None,
     stack_offset: int = 1,
 ) -> SimpleNamespace:
-    caller_file = inspect.getfile(inspect.stack()[stack_offset].frame)
+    caller_file = inspect.getfile(sys._getframe(stack_offset))
     ns_dict = runpy.run_path(
         str(Path(caller_file).with_name(file_name)),
         init_globals=vars,
@@ -0,0 +1,35 @@
+from adaptix._internal.code_tools.code_builder import CodeBuilder
+from adaptix._internal.code_tools.compiler import BasicClosureCompiler, CodeCache
+
+
+def _make_builder() -> CodeBuilder:
+    builder = CodeBuilder()
+    builder += """
+        def closure(x):
+            return x + offset
+
+        return closure
+    """
+    return builder
+
+
+def test_code_is_reused():
+    compiler = BasicClosureCompiler()
+
+    first = compiler.compile("test_code_is_reused", lambda uid: f"<{uid}>", _make_builder(), {"offset": 1})
+    second = compiler.compile("test_code_is_reused", lambda uid: f"<{uid}>", _make_builder(), {"offset": 10})
+
+    assert first(1) == 2
+    assert second(1) == 11
+    assert first.__code__ is second.__code__
+
+
+def test_code_cache_eviction():
+    cache = CodeCache(max_size=2)
+
+    code_a = cache.get_or_compile("a = 1", "<a>")
+    assert cache.get_or_compile("a = 1", "<a>") is code_a
+
+    cache.get_or_compile("b = 1", "<b>")
+    cache.get_or_compile("c = 1", "<c>")
+    assert cache.get_or_compile("a = 1", "<a>") is not code_a